@@ -1,35 +1,142 @@
 #!/usr/bin/env python3
 
+import os
+import glob
+import re
 import psutil
 import time
 import argparse
 import platform
 import logging
+import itertools
 import json
+import atexit
+import signal
+import sys
 import smtplib
+import queue
+import threading
 from email.message import EmailMessage
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# Use orjson for metric export when installed; it returns compact bytes directly
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Platform checks, evaluated once
+PLATFORM = platform.system()
+IS_WINDOWS = PLATFORM == "Windows"
+# sensors_temperatures() only exists on Linux/FreeBSD
+HAS_SENSORS = not IS_WINDOWS and hasattr(psutil, "sensors_temperatures")
 
 # Configuration constants
 LOG_FILE = "system_monitor.log"
+JSON_FILE = "system_metrics.json"
+JSON_FLUSH_EVERY = 100  # Records buffered before flushing the JSON file
 ALERT_EMAIL = "alert@example.com"
 EMAIL_ENABLED = False
+ALERT_QUEUE_SIZE = 64  # Pending alert emails before new ones are dropped
+SMTP_NOOP_INTERVAL = 60  # Idle seconds between keepalive NOOPs on the SMTP connection
+ALERT_COOLDOWN = 300  # Seconds before a still-active alert is repeated
+ALERT_MARGIN = 5.0  # How far below its threshold a metric must drop to clear an alert
+SAMPLE_QUEUE_SIZE = 16  # Collected samples waiting to be logged before new ones are dropped
+CPU_MIN_GAP = 0.1  # Seconds; CPU reads closer together than this reuse the last value
+TEMP_CACHE_TTL = 5  # Seconds to reuse a temperature reading; sensors change slowly
 
-# Send alert emails if enabled
-def send_email_alert(subject, body):
-    if not EMAIL_ENABLED:
-        return
+# Read CPU, memory, disk and network straight from /proc and statvfs on Linux; psutil elsewhere
+FAST_PROC = PLATFORM == "Linux" and os.path.exists("/proc/stat")
+_fd_stat = None
+_fd_meminfo = None
+_fd_netdev = None
+_cpu_last = (0, 0)  # (idle, total) jiffies at the previous CPU reading
+
+# Last CPU percentage handed out and when it was read, for the CPU_MIN_GAP gate
+_last_cpu_time = 0.0
+_last_cpu = None
+
+# Network byte counters at the previous reading, for computing transfer rates
+_net_last = None  # ({interface: (bytes_recv, bytes_sent)}, monotonic time)
+
+# Daemon thread running the current disk probe, so a hung mount can't freeze collection
+_disk_thread = None
+
+# Cached result of psutil.sensors_temperatures() and when it was taken
+_temps_cache = None
+_temps_cache_time = 0.0
+
+# Kept-open descriptor for the sysfs input behind the first valid reading, and when it was last searched for
+HWMON_DIR = "/sys/class/hwmon"
+CORETEMP_HWMON_GLOB = "/sys/devices/platform/coretemp.*/hwmon/hwmon*"
+THERMAL_DIR = "/sys/class/thermal"
+_temp_fd = None
+_temp_search_time = None
+
+# JSON metrics file, opened once and kept for the process lifetime
+_json_fp = None
+_json_pending = 0
+
+# Alert emails waiting for the background sender thread
+_alert_q = queue.Queue(maxsize=ALERT_QUEUE_SIZE)
+_alert_thread = None
+
+# Close an SMTP connection, ignoring errors from an already broken one
+def _close_smtp(server):
     try:
+        server.quit()
+    except Exception:
+        server.close()
+
+# Background sender: drains the alert queue over a single reused SMTP connection
+def _alert_worker():
+    server = None
+    while True:
+        try:
+            subject, body = _alert_q.get(timeout=SMTP_NOOP_INTERVAL)
+        except queue.Empty:
+            # Keep the idle connection alive, or drop it so the next alert reconnects
+            if server is not None:
+                try:
+                    server.noop()
+                except Exception:
+                    _close_smtp(server)
+                    server = None
+            continue
+
         msg = EmailMessage()
         msg.set_content(body)
         msg["Subject"] = subject
         msg["From"] = ALERT_EMAIL
         msg["To"] = ALERT_EMAIL
-        with smtplib.SMTP("localhost") as server:
-            server.send_message(msg)
-    except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        # Retry once on a fresh connection in case the kept one went stale
+        for attempt in range(2):
+            try:
+                if server is None:
+                    server = smtplib.SMTP("localhost")
+                server.send_message(msg)
+                break
+            except Exception as e:
+                if server is not None:
+                    _close_smtp(server)
+                    server = None
+                if attempt:
+                    logger.error(f"Failed to send email: {e}")
+
+# Queue an alert email if enabled; never blocks the monitoring loop
+def send_email_alert(subject, body):
+    global _alert_thread
+    if not EMAIL_ENABLED:
+        return
+    if _alert_thread is None:
+        _alert_thread = threading.Thread(target=_alert_worker, name="AlertSender", daemon=True)
+        _alert_thread.start()
+    try:
+        _alert_q.put_nowait((subject, body))
+    except queue.Full:
+        logger.error(f"Alert queue full, dropping email: {subject}")
 
 # Logger setup with rotating file and console handlers
 logger = logging.getLogger("SystemMonitor")
@@ -39,17 +146,126 @@ formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 file_handler = RotatingFileHandler(LOG_FILE, maxBytes=1048576, backupCount=3)
 file_handler.setFormatter(formatter)
 file_handler.setLevel(logging.INFO)
-logger.addHandler(file_handler)
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
 console_handler.setLevel(logging.INFO)
-logger.addHandler(console_handler)
+
+# Hand records to the listener as-is so message formatting happens off the calling thread
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        return record
+
+# File and console output run on the listener's thread; logging calls only enqueue
+log_queue = queue.Queue(-1)
+logger.addHandler(_DeferredQueueHandler(log_queue))
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# CPU usage since the previous call, from the aggregate line of /proc/stat
+def _cpu_linux():
+    global _fd_stat, _cpu_last
+    if _fd_stat is None:
+        _fd_stat = os.open("/proc/stat", os.O_RDONLY)
+    # Parse the counters straight from bytes; int() accepts them without decoding
+    fields = os.pread(_fd_stat, 256, 0).split(b"\n", 1)[0].split()
+    # user nice system idle iowait irq softirq steal; guest time is already in user/nice
+    times = [int(x) for x in fields[1:9]]
+    idle = times[3] + times[4]
+    total = sum(times)
+    last_idle, last_total = _cpu_last
+    _cpu_last = (idle, total)
+    if total <= last_total:
+        return 0.0
+    return round((1 - (idle - last_idle) / (total - last_total)) * 100, 1)
+
+# Memory usage from MemTotal and MemAvailable, the first and third lines of /proc/meminfo
+def _mem_linux():
+    global _fd_meminfo
+    if _fd_meminfo is None:
+        _fd_meminfo = os.open("/proc/meminfo", os.O_RDONLY)
+    lines = os.pread(_fd_meminfo, 256, 0).split(b"\n", 3)
+    if not lines[2].startswith(b"MemAvailable:"):
+        # Kernels before 3.14 don't report MemAvailable
+        return psutil.virtual_memory().percent
+    total = int(lines[0].split()[1])
+    available = int(lines[2].split()[1])
+    return round((total - available) / total * 100, 1)
+
+# Read a whole /proc file from a kept-open descriptor. A single read of a seq_file returns
+# at most about a page of records, so keep reading until EOF
+def _pread_all(fd):
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+# Bytes received and sent per interface, like psutil.net_io_counters(pernic=True)
+def _net_linux():
+    global _fd_netdev
+    if _fd_netdev is None:
+        _fd_netdev = os.open("/proc/net/dev", os.O_RDONLY)
+    counters = {}
+    # Two header lines, then "iface: rx_bytes rx_packets ... (8 rx fields) tx_bytes ..."
+    for line in _pread_all(_fd_netdev).splitlines()[2:]:
+        name, data = line.split(b":", 1)
+        fields = data.split()
+        counters[name.strip().decode()] = (int(fields[0]), int(fields[8]))
+    return counters
+
+# Disk usage from statvfs, computed the same way as psutil.disk_usage()
+def _disk_linux(path):
+    st = os.statvfs(path)
+    used = st.f_blocks - st.f_bfree
+    total = used + st.f_bavail
+    return round(used / total * 100, 1) if total else 0.0
+
+# Close the /proc and hwmon descriptors kept open across cycles
+def _close_kept_fds():
+    for fd in (_fd_stat, _fd_meminfo, _fd_netdev, _temp_fd):
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+atexit.register(_close_kept_fds)
+
+# Raw metric readers, using the /proc fast path when available.
+# Back-to-back CPU reads give a near-empty sampling window, so they reuse the last value
+def read_cpu_percent():
+    global _last_cpu_time, _last_cpu
+    now = time.monotonic()
+    if now - _last_cpu_time < CPU_MIN_GAP:
+        return _last_cpu
+    _last_cpu = _cpu_linux() if FAST_PROC else psutil.cpu_percent(interval=None)
+    _last_cpu_time = now
+    return _last_cpu
+
+def read_memory_percent():
+    return _mem_linux() if FAST_PROC else psutil.virtual_memory().percent
+
+def read_disk_percent(path):
+    return _disk_linux(path) if FAST_PROC else psutil.disk_usage(path).percent
+
+def read_network_counters():
+    if FAST_PROC:
+        return _net_linux()
+    return {nic: (io.bytes_recv, io.bytes_sent) for nic, io in psutil.net_io_counters(pernic=True).items()}
+
+def read_network_io():
+    counters = read_network_counters().values()
+    return sum(recv for recv, _ in counters), sum(sent for _, sent in counters)
 
 # Retrieve CPU usage percentage
 def get_cpu_usage():
     try:
-        return psutil.cpu_percent(interval=1)
+        return read_cpu_percent()
     except Exception as e:
         logger.error(f"Could not retrieve CPU usage: {e}")
         return None
@@ -57,7 +273,7 @@ def get_cpu_usage():
 # Retrieve memory usage percentage
 def get_memory_usage():
     try:
-        return psutil.virtual_memory().percent
+        return read_memory_percent()
     except Exception as e:
         logger.error(f"Could not retrieve Memory usage: {e}")
         return None
@@ -65,7 +281,7 @@ def get_memory_usage():
 # Retrieve disk usage for the specified path
 def get_disk_usage(path='/'):
     try:
-        return psutil.disk_usage(path).percent
+        return read_disk_percent(path)
     except FileNotFoundError:
         logger.error(f"Disk path '{path}' not found.")
         return None
@@ -73,118 +289,377 @@ def get_disk_usage(path='/'):
         logger.error(f"Could not retrieve Disk usage for '{path}': {e}")
         return None
 
+# Read all temperature sensors, reusing the last result for TEMP_CACHE_TTL seconds
+def read_sensor_temperatures():
+    global _temps_cache, _temps_cache_time
+    now = time.monotonic()
+    if _temps_cache is None or now - _temps_cache_time >= TEMP_CACHE_TTL:
+        _temps_cache = psutil.sensors_temperatures() if HAS_SENSORS else {}
+        _temps_cache_time = now
+    return _temps_cache
+
+# Pick the first available reading out of a sensors_temperatures() result
+def first_temperature(temps):
+    if not temps:
+        return None
+    return next((entry.current for entries in temps.values() for entry in entries
+                 if getattr(entry, 'current', None) is not None), None)
+
+# Read a sysfs sensor file, returning its stripped contents
+def _read_sysfs(path):
+    with open(path) as f:
+        return f.read().strip()
+
+# Locate the sysfs file behind the first sensors_temperatures() reading, searching the
+# same paths in the same order as psutil so both agree on which sensor is "first"
+def find_temperature_input():
+    bases = glob.glob(os.path.join(HWMON_DIR, "hwmon*", "temp*_*"))
+    bases.extend(glob.glob(os.path.join(HWMON_DIR, "hwmon*", "device", "temp*_*")))
+    bases = sorted({x.split('_')[0] for x in bases})
+    # coretemp entries are only added when not already listed under the hwmon class
+    for name in glob.glob(os.path.join(CORETEMP_HWMON_GLOB, "temp*_*")):
+        if re.sub(r"/sys/devices/platform/coretemp.*/hwmon/", HWMON_DIR + "/", name) not in bases:
+            bases.append(name)
+    for base in bases:
+        try:
+            float(_read_sysfs(base + "_input"))
+            _read_sysfs(os.path.join(os.path.dirname(base), "name"))
+        except (OSError, ValueError):
+            continue
+        return base + "_input"
+
+    # Without any hwmon sensors psutil falls back to thermal zones
+    if not bases:
+        for base in sorted(set(glob.glob(os.path.join(THERMAL_DIR, "thermal_zone*")))):
+            try:
+                float(_read_sysfs(os.path.join(base, "temp")))
+                _read_sysfs(os.path.join(base, "type"))
+            except (OSError, ValueError):
+                continue
+            return os.path.join(base, "temp")
+    return None
+
+# Read the first available sensor, via the cached sysfs descriptor once it is known
+def read_temperature():
+    global _temp_fd, _temp_search_time
+    if not HAS_SENSORS:
+        return None
+    if _temp_fd is not None:
+        try:
+            return int(os.pread(_temp_fd, 32, 0)) / 1000
+        except (OSError, ValueError):
+            # Sensor vanished; drop the descriptor and rediscover below
+            os.close(_temp_fd)
+            _temp_fd = None
+    temp = first_temperature(read_sensor_temperatures())
+    now = time.monotonic()
+    # Search at most once per TTL, so a sensor that can't be located isn't searched for every cycle
+    if temp is not None and hasattr(os, "pread") and (
+            _temp_search_time is None or now - _temp_search_time >= TEMP_CACHE_TTL):
+        _temp_search_time = now
+        path = find_temperature_input()
+        if path is not None:
+            try:
+                _temp_fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                _temp_fd = None
+    return temp
+
 # Retrieve temperature from the first available sensor
 def get_temperature():
     try:
-        temps = psutil.sensors_temperatures()
-        if not temps:
-            return None
-        for entries in temps.values():
-            for entry in entries:
-                if hasattr(entry, 'current') and entry.current is not None:
-                    return entry.current
-        return None
+        return read_temperature()
     except Exception as e:
         logger.error(f"Could not retrieve temperature: {e}")
         return None
 
 # Export current metrics to JSON for external use
-def export_metrics_to_json(cpu, mem, disk, path, net_in, net_out, temp):
+def export_metrics_to_json(timestamp, cpu, mem, disk, path, net_in, net_out, temp):
     metrics = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "ts_ns": timestamp,
         "cpu_percent": cpu,
         "memory_percent": mem,
         "disk_percent": disk,
         "disk_path": path,
-        "network_bytes_sent": net_out,
-        "network_bytes_recv": net_in,
+        "net_in_Bps": net_in,
+        "net_out_Bps": net_out,
         "temperature_celsius": temp
     }
+    global _json_fp, _json_pending
     try:
-        with open("system_metrics.json", "a") as f:
-            f.write(json.dumps(metrics) + "\n")
+        if _json_fp is None:
+            _json_fp = open(JSON_FILE, "ab", buffering=1 << 16)
+            atexit.register(_json_fp.close)
+        _json_fp.write(_dumps(metrics) + b"\n")
+        _json_pending += 1
+        if _json_pending >= JSON_FLUSH_EVERY:
+            _json_fp.flush()
+            _json_pending = 0
     except Exception as e:
         logger.error(f"Failed to export metrics to JSON: {e}")
 
-# Get total network input/output in bytes
+# Get total network input/output in bytes (cumulative counters)
 def get_network_io():
     try:
-        net_io = psutil.net_io_counters()
-        return net_io.bytes_recv, net_io.bytes_sent
+        return read_network_io()
     except Exception as e:
         logger.error(f"Could not retrieve Network I/O: {e}")
         return None, None
 
-# Main monitoring loop for system metrics
-def monitor_system(cpu_threshold, mem_threshold, disk_threshold, disk_path, interval, log_to_json, alert_temp):
-    logger.info("System monitor started")
-    logger.info(f"Config - Interval: {interval}s, CPU>{cpu_threshold}%, Mem>{mem_threshold}%, Disk>{disk_threshold}% at '{disk_path}'")
-    logger.info("-" * 50)
+# Get per-interface network byte counters
+def get_network_counters():
+    try:
+        return read_network_counters()
+    except Exception as e:
+        logger.error(f"Could not retrieve Network I/O: {e}")
+        return None
+
+# Turn per-interface byte counters into total bytes/second since the previous call.
+# Deltas are taken per interface so interfaces appearing or disappearing between
+# samples don't show up as traffic spikes or drops
+def network_rate(counters):
+    global _net_last
+    if counters is None:
+        return None, None
+    now = time.monotonic()
+    last, _net_last = _net_last, (counters, now)
+    if last is None or now <= last[1]:
+        return 0, 0
+    previous, then = last
+    recv_delta = sent_delta = 0
+    for nic, (recv, sent) in counters.items():
+        if nic not in previous:
+            continue  # New interface; it has no baseline until the next sample
+        prev_recv, prev_sent = previous[nic]
+        # A per-interface counter only goes backwards when it resets; count no traffic then
+        recv_delta += max(0, recv - prev_recv)
+        sent_delta += max(0, sent - prev_sent)
+    elapsed = now - then
+    return int(recv_delta / elapsed), int(sent_delta / elapsed)
+
+# Start the CPU and network deltas without reporting them; the first sample is taken
+# one interval later, so the monitoring interval is the CPU averaging window throughout
+def prime_counters():
+    global _last_cpu, _last_cpu_time
+    try:
+        if FAST_PROC:
+            _cpu_linux()
+        else:
+            psutil.cpu_percent(interval=None)
+        network_rate(read_network_counters())
+    except Exception:
+        pass  # The first snapshot reports the error
+    _last_cpu, _last_cpu_time = None, 0.0
 
+# Collect every metric in one pass; a metric that can't be read is logged and reported as None
+def snapshot(path='/', disk_timeout=None):
+    global _disk_thread
+    # disk usage is the one probe that can stall (hung network mount), so it runs on its
+    # own thread, overlapping the other probes, and is abandoned after disk_timeout seconds
+    disk_result = []
+    if _disk_thread is not None and _disk_thread.is_alive():
+        # The previous probe is still stuck; don't pile another thread up behind it
+        logger.warning(f"Disk probe for '{path}' is still stalled, skipping it this cycle")
+        disk_thread = None
+    else:
+        disk_thread = _disk_thread = threading.Thread(
+            target=lambda: disk_result.append(get_disk_usage(path)), name="DiskProbe", daemon=True)
+        disk_thread.start()
+    mem = get_memory_usage()
+    net_counters = get_network_counters()
+    temp = get_temperature()
+    cpu = get_cpu_usage()
+    disk = None
+    if disk_thread is not None:
+        disk_thread.join(disk_timeout)
+        if disk_result:
+            disk = disk_result[0]
+        else:
+            logger.warning(f"Disk probe for '{path}' timed out after {disk_timeout}s")
+    return (cpu, mem, disk, *network_rate(net_counters), temp)
+
+# Per-metric alert state: fires on the rising edge, repeats at most every
+# cooldown seconds while the metric stays high, and clears below threshold - margin
+class AlertState:
+    def __init__(self, label, unit, cooldown=ALERT_COOLDOWN, margin=ALERT_MARGIN):
+        self.label = label
+        self.unit = unit
+        self.cooldown = cooldown
+        self.margin = margin
+        self.active = False
+        self.last_fired = 0.0
+
+    # Return an alert message if one should be raised for this reading, else None
+    def update(self, value, threshold):
+        if value is None or threshold is None:
+            return None
+        if value > threshold:
+            now = time.monotonic()
+            if self.active and now - self.last_fired < self.cooldown:
+                return None
+            self.active = True
+            self.last_fired = now
+            return f"High {self.label}: {value:.1f}{self.unit} (Threshold: {threshold}{self.unit})"
+        if value < threshold - self.margin:
+            self.active = False
+        return None
+
+# Build the per-cycle log line; failed metrics print "Error" instead of a value
+def _line_format(cpu_ok, mem_ok, disk_ok, net_ok, temp_ok):
+    return " | ".join((
+        "CPU: %.1f%%" if cpu_ok else "CPU: Error",
+        "Memory: %.1f%%" if mem_ok else "Memory: Error",
+        "Disk (%s): %.1f%%" if disk_ok else "Disk (%s): Error",
+        "Net In: %d B/s | Net Out: %d B/s" if net_ok else "Network: Error",
+        "Temp: %.1f°C" if temp_ok else "Temp: Error",
+    ))
+
+# Log line formats keyed by which metrics were read successfully, built once
+_LINE_FORMATS = {ok: _line_format(*ok) for ok in itertools.product((True, False), repeat=5)}
+
+# Collector thread: takes a snapshot every interval and hands it to the consumer
+def collect_metrics(disk_path, interval, samples, stop, collected):
+    # Bind hot-loop lookups to locals once
+    monotonic, time_ns, put_nowait, wait, stopped = time.monotonic, time.time_ns, samples.put_nowait, stop.wait, stop.is_set
+
+    prime_counters()
+    next_tick = monotonic()
     try:
         while True:
-            # Gather metrics
-            cpu_usage = get_cpu_usage()
-            mem_usage = get_memory_usage()
-            disk_usage = get_disk_usage(disk_path)
-            net_in, net_out = get_network_io()
-            temperature = get_temperature()
-
-            # Format output for logging
-            cpu_display = f"{cpu_usage:.1f}%" if cpu_usage is not None else "Error"
-            mem_display = f"{mem_usage:.1f}%" if mem_usage is not None else "Error"
-            disk_display = f"{disk_usage:.1f}%" if disk_usage is not None else "Error"
-            net_display = f"Net In: {net_in} B | Net Out: {net_out} B" if None not in (net_in, net_out) else "Network: Error"
-            temp_display = f"Temp: {temperature:.1f}°C" if temperature is not None else "Temp: Error"
-
-            logger.info(f"CPU: {cpu_display} | Memory: {mem_display} | Disk ({disk_path}): {disk_display} | {net_display} | {temp_display}")
+            # Wait until the next deadline so collection time doesn't add drift
+            next_tick += interval
+            delay = next_tick - monotonic()
+            if delay > 0:
+                wait(delay)
+            elif delay < 0:
+                logger.warning(f"Monitoring cycle overran interval by {-delay:.2f}s")
+                next_tick = monotonic()
+            if stopped():
+                break
+
+            sample = (time_ns(), snapshot(disk_path, interval))
+            try:
+                put_nowait(sample)
+            except queue.Full:
+                logger.warning("Sample queue full, dropping metrics sample")
+    except Exception as e:
+        logger.critical(f"Critical error during metric collection: {e}")
+        stop.set()
+    finally:
+        # Lets the consumer know no more samples are coming
+        collected.set()
+
+# Consumer thread: logs, exports and raises alerts for each collected sample, and
+# keeps draining the queue until the collector has exited so no sample is lost
+def process_metrics(cpu_threshold, mem_threshold, disk_threshold, disk_path, log_to_json, alert_temp, samples, stop,
+                    collected):
+    alerts = (
+        ("CPU Alert", AlertState("CPU Usage", "%"), cpu_threshold),
+        ("Memory Alert", AlertState("Memory Usage", "%"), mem_threshold),
+        ("Disk Alert", AlertState(f"Disk Usage ({disk_path})", "%"), disk_threshold),
+        ("Temperature Alert", AlertState("Temperature", "°C"), alert_temp),
+    )
+
+    # Bind hot-loop lookups to locals once
+    get, finished = samples.get, collected.is_set
+    info, warning, info_enabled = logger.info, logger.warning, logger.isEnabledFor
+    line_formats = _LINE_FORMATS
+
+    try:
+        while True:
+            # Checked before get() so an empty queue afterwards really means nothing is left
+            done = finished()
+            try:
+                timestamp, metrics = get(timeout=0.5)
+            except queue.Empty:
+                if done:
+                    break
+                continue
+            cpu_usage, mem_usage, disk_usage, net_in, net_out, temperature = metrics
+
+            # Log the cycle; formatting is deferred to the handlers and skipped when INFO is off
+            if info_enabled(logging.INFO):
+                net_ok = None not in (net_in, net_out)
+                line = line_formats[(cpu_usage is not None, mem_usage is not None, disk_usage is not None,
+                                      net_ok, temperature is not None)]
+                values = (cpu_usage, mem_usage, disk_path, disk_usage) + ((net_in, net_out) if net_ok else ()) + (temperature,)
+                info(line, *[v for v in values if v is not None])
 
             # Optionally export to JSON
             if log_to_json:
-                export_metrics_to_json(cpu_usage, mem_usage, disk_usage, disk_path, net_in, net_out, temperature)
-
-            # Trigger alerts for thresholds
-            if cpu_usage is not None and cpu_usage > cpu_threshold:
-                msg = f"High CPU Usage: {cpu_usage:.1f}% (Threshold: {cpu_threshold}%)"
-                logger.warning(msg)
-                send_email_alert("CPU Alert", msg)
-            if mem_usage is not None and mem_usage > mem_threshold:
-                msg = f"High Memory Usage: {mem_usage:.1f}% (Threshold: {mem_threshold}%)"
-                logger.warning(msg)
-                send_email_alert("Memory Alert", msg)
-            if disk_usage is not None and disk_usage > disk_threshold:
-                msg = f"High Disk Usage ({disk_path}): {disk_usage:.1f}% (Threshold: {disk_threshold}%)"
-                logger.warning(msg)
-                send_email_alert("Disk Alert", msg)
-            if alert_temp is not None and temperature is not None and temperature > alert_temp:
-                msg = f"High Temperature: {temperature:.1f}°C (Threshold: {alert_temp}°C)"
-                logger.warning(msg)
-                send_email_alert("Temperature Alert", msg)
-
-            time.sleep(interval)
+                export_metrics_to_json(timestamp, cpu_usage, mem_usage, disk_usage, disk_path, net_in, net_out, temperature)
 
-    except KeyboardInterrupt:
-        logger.info("Monitoring interrupted by user.")
+            # Trigger alerts for thresholds, suppressing repeats of an ongoing alert
+            values = (cpu_usage, mem_usage, disk_usage, temperature)
+            for (subject, state, threshold), value in zip(alerts, values):
+                msg = state.update(value, threshold)
+                if msg:
+                    warning(msg)
+                    send_email_alert(subject, msg)
     except Exception as e:
         logger.critical(f"Critical error during monitoring: {e}")
+        stop.set()
 
-# Parse arguments from command line
-def parse_args():
+# Main monitoring entry point: runs collection and processing on separate threads
+# so a slow psutil call never holds up logging and alerts, or vice versa
+def monitor_system(cpu_threshold, mem_threshold, disk_threshold, disk_path, interval, log_to_json, alert_temp):
+    logger.info("System monitor started")
+    logger.info(f"Config - Interval: {interval}s, CPU>{cpu_threshold}%, Mem>{mem_threshold}%, Disk>{disk_threshold}% at '{disk_path}'")
+    logger.info("-" * 50)
+
+    samples = queue.Queue(maxsize=SAMPLE_QUEUE_SIZE)
+    stop = threading.Event()
+    collected = threading.Event()
+    threads = (
+        threading.Thread(target=collect_metrics, name="Collector",
+                         args=(disk_path, interval, samples, stop, collected)),
+        threading.Thread(target=process_metrics, name="Consumer",
+                         args=(cpu_threshold, mem_threshold, disk_threshold, disk_path, log_to_json, alert_temp,
+                               samples, stop, collected)),
+    )
+    for thread in threads:
+        thread.start()
+
+    try:
+        # Wake up periodically so KeyboardInterrupt is delivered promptly
+        while not stop.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        logger.info("Monitoring interrupted by user.")
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+# Build the command line parser once at import
+def _build_parser():
     parser = argparse.ArgumentParser(description="Enhanced System Resource Monitor")
     parser.add_argument('--cpu', type=float, default=85.0, help='CPU usage warning threshold (default: 85.0)')
     parser.add_argument('--mem', type=float, default=85.0, help='Memory usage warning threshold (default: 85.0)')
     parser.add_argument('--disk', type=float, default=90.0, help='Disk usage warning threshold (default: 90.0)')
     parser.add_argument('--path', type=str, default='/', help="Disk path to monitor")
-    parser.add_argument('--interval', type=int, default=5, help='Monitoring interval in seconds (default: 5)')
+    parser.add_argument('--interval', type=int, default=5, help='Monitoring interval in seconds, also the CPU averaging window (default: 5)')
     parser.add_argument('--log-json', action='store_true', help='Log metrics to JSON file')
     parser.add_argument('--temp-threshold', type=float, help='Temperature warning threshold in Celsius')
-    return parser.parse_args()
+    return parser
+
+_PARSER = _build_parser()
+
+# Parse arguments from command line
+def parse_args():
+    args = _PARSER.parse_args()
+    if args.interval <= 0:
+        _PARSER.error("--interval must be a positive number of seconds")
+    return args
 
 # Entry point for script execution
 if __name__ == "__main__":
     args = parse_args()
 
-    if platform.system() == "Windows" and args.path == '/':
+    # Exit cleanly on SIGTERM so atexit hooks flush buffered JSON metrics
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    if IS_WINDOWS and args.path == '/':
         args.path = 'C:\\'
         logger.info("Windows platform detected. Adjusted disk path to C:\\")
 
@@ -2,12 +2,22 @@
 
 import psutil
 import time
+import atexit
+import queue
+import signal
+import sys
 import argparse
 import platform
 import logging
-from logging.handlers import RotatingFileHandler
+import itertools
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 LOG_FILE = "system_monitor.log"
+CPU_MIN_GAP = 0.1
+IS_WINDOWS = platform.system() == "Windows"
+
+_last_cpu_time = 0.0
+_last_cpu = None
 
 logger = logging.getLogger("SystemMonitor")
 logger.setLevel(logging.DEBUG)
@@ -16,16 +26,30 @@ formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 file_handler = RotatingFileHandler(LOG_FILE, maxBytes=1048576, backupCount=3)
 file_handler.setFormatter(formatter)
 file_handler.setLevel(logging.INFO)
-logger.addHandler(file_handler)
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
 console_handler.setLevel(logging.INFO)
-logger.addHandler(console_handler)
+
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        return record
+
+log_queue = queue.Queue(-1)
+logger.addHandler(_DeferredQueueHandler(log_queue))
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 def get_cpu_usage():
+    global _last_cpu_time, _last_cpu
+    now = time.monotonic()
+    if now - _last_cpu_time < CPU_MIN_GAP:
+        return _last_cpu
     try:
-        return psutil.cpu_percent(interval=1)
+        _last_cpu = psutil.cpu_percent(interval=None)
+        _last_cpu_time = now
+        return _last_cpu
     except Exception as e:
         logger.error(f"Could not retrieve CPU usage: {e}")
         return None
@@ -47,50 +71,85 @@ def get_disk_usage(path='/'):
         logger.error(f"Could not retrieve Disk usage for '{path}': {e}")
         return None
 
+def _line_format(cpu_ok, mem_ok, disk_ok):
+    return " | ".join((
+        "CPU: %.1f%%" if cpu_ok else "CPU: Error",
+        "Memory: %.1f%%" if mem_ok else "Memory: Error",
+        "Disk (%s): %.1f%%" if disk_ok else "Disk (%s): Error",
+    ))
+
+_LINE_FORMATS = {ok: _line_format(*ok) for ok in itertools.product((True, False), repeat=3)}
+
 def monitor_system(cpu_threshold, mem_threshold, disk_threshold, disk_path, interval):
     logger.info("System monitor started")
     logger.info(f"Config - Interval: {interval}s, CPU>{cpu_threshold}%, Mem>{mem_threshold}%, Disk>{disk_threshold}% at '{disk_path}'")
     logger.info("-" * 50)
 
+    checks = (
+        ("CPU Usage", cpu_threshold),
+        ("Memory Usage", mem_threshold),
+        (f"Disk Usage ({disk_path})", disk_threshold),
+    )
+
+    # Bind hot-loop lookups to locals once
+    monotonic, sleep = time.monotonic, time.sleep
+    info, warning, info_enabled = logger.info, logger.warning, logger.isEnabledFor
+    line_formats = _LINE_FORMATS
+
+    # Prime the CPU counters here and take the first sample one interval later, so it
+    # averages over a full window rather than the few milliseconds since startup
+    psutil.cpu_percent(interval=None)
+    next_tick = monotonic()
     try:
         while True:
+            next_tick += interval
+            delay = next_tick - monotonic()
+            if delay > 0:
+                sleep(delay)
+            elif delay < 0:
+                warning(f"Monitoring cycle overran interval by {-delay:.2f}s")
+                next_tick = monotonic()
+
             cpu_usage = get_cpu_usage()
             mem_usage = get_memory_usage()
             disk_usage = get_disk_usage(disk_path)
 
-            cpu_display = f"{cpu_usage:.1f}%" if cpu_usage is not None else "Error"
-            mem_display = f"{mem_usage:.1f}%" if mem_usage is not None else "Error"
-            disk_display = f"{disk_usage:.1f}%" if disk_usage is not None else "Error"
+            if info_enabled(logging.INFO):
+                line = line_formats[(cpu_usage is not None, mem_usage is not None, disk_usage is not None)]
+                values = (cpu_usage, mem_usage, disk_path, disk_usage)
+                info(line, *[v for v in values if v is not None])
 
-            logger.info(f"CPU: {cpu_display} | Memory: {mem_display} | Disk ({disk_path}): {disk_display}")
-
-            if cpu_usage is not None and cpu_usage > cpu_threshold:
-                logger.warning(f"High CPU Usage: {cpu_usage:.1f}% (Threshold: {cpu_threshold}%)")
-            if mem_usage is not None and mem_usage > mem_threshold:
-                logger.warning(f"High Memory Usage: {mem_usage:.1f}% (Threshold: {mem_threshold}%)")
-            if disk_usage is not None and disk_usage > disk_threshold:
-                logger.warning(f"High Disk Usage ({disk_path}): {disk_usage:.1f}% (Threshold: {disk_threshold}%)")
-
-            time.sleep(interval)
+            for (name, threshold), value in zip(checks, (cpu_usage, mem_usage, disk_usage)):
+                if value is not None and value > threshold:
+                    warning("High %s: %.1f%% (Threshold: %s%%)", name, value, threshold)
 
     except KeyboardInterrupt:
         logger.info("Monitoring interrupted by user.")
     except Exception as e:
         logger.critical(f"Critical error during monitoring: {e}")
 
-def parse_args():
+def _build_parser():
     parser = argparse.ArgumentParser(description="Production-Ready System Resource Monitor")
     parser.add_argument('--cpu', type=float, default=85.0, help='CPU usage warning threshold (default: 85.0)')
     parser.add_argument('--mem', type=float, default=85.0, help='Memory usage warning threshold (default: 85.0)')
     parser.add_argument('--disk', type=float, default=90.0, help='Disk usage warning threshold (default: 90.0)')
     parser.add_argument('--path', type=str, default='/', help="Disk path to monitor")
-    parser.add_argument('--interval', type=int, default=5, help='Monitoring interval in seconds (default: 5)')
-    return parser.parse_args()
+    parser.add_argument('--interval', type=int, default=5, help='Monitoring interval in seconds, also the CPU averaging window (default: 5)')
+    return parser
+
+_PARSER = _build_parser()
+
+def parse_args():
+    args = _PARSER.parse_args()
+    if args.interval <= 0:
+        _PARSER.error("--interval must be a positive number of seconds")
+    return args
 
 if __name__ == "__main__":
     args = parse_args()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
 
-    if platform.system() == "Windows" and args.path == '/':
+    if IS_WINDOWS and args.path == '/':
         args.path = 'C:\\'
         logger.info("Windows platform detected. Adjusted disk path to C:\\")
 